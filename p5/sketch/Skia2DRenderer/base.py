@@ -4,7 +4,7 @@ import skia
 from OpenGL import GL
 
 import copy
-from ..events import handler_names
+from ..events import handler_names, HandlerQueue
 from .handlers import *
 from .util import *
 
@@ -56,7 +56,7 @@ class SkiaSketch:
         for handler_name in handler_names:
             self.handlers[handler_name] = handlers.get(handler_name, _dummy)
 
-        self.handler_queue = []
+        self.handler_queue = HandlerQueue()
 
     @property
     def size(self):
@@ -141,8 +141,7 @@ class SkiaSketch:
                 p5.renderer.reset()
 
             self.poll_events()
-            while len(self.handler_queue) != 0:
-                function, event = self.handler_queue.pop(0)
+            for function, event in self.handler_queue.drain():
                 event._update_builtins()
                 function(event)
 
@@ -238,7 +237,7 @@ class SkiaSketch:
         self.resized = True
 
     def _enqueue_event(self, handler_name, event):
-        self.handler_queue.append((self.handlers[handler_name], event))
+        self.handler_queue.append(handler_name, self.handlers[handler_name], event)
 
     def exit(self):
         self.clean_up()
@@ -60,7 +60,7 @@ KEYMAP = {
     glfw.KEY_TAB: keys.TAB,
 }
 
-MOD_KEYS = [keys.SHIFT, keys.ALT, keys.CONTROL, keys.META]
+MOD_KEYS = frozenset((keys.SHIFT, keys.ALT, keys.CONTROL, keys.META))
 
 
 @dataclass
@@ -206,9 +206,10 @@ def on_key_char(window, text):
         return
 
     (action, key, mod) = input_state.next_key_events.pop(0)
+    text = chr(text)
     input_state.next_key_text[key] = text
 
-    event = PseudoKeyEvent(key, mod, chr(text))
+    event = PseudoKeyEvent(key, mod, text)
     kev = KeyEvent(event, action == glfw.PRESS)
 
     p5.sketch._enqueue_event(
@@ -28,6 +28,7 @@ from p5.core import p5
 from ..events import KeyEvent
 from ..events import MouseEvent
 from ..events import handler_names
+from ..events import HandlerQueue
 
 
 def _dummy(*args, **kwargs):
@@ -80,7 +81,7 @@ class VispySketch(app.Canvas):
         for handler_name in handler_names:
             self.handlers[handler_name] = handlers.get(handler_name, _dummy)
 
-        self.handler_queue = []
+        self.handler_queue = HandlerQueue()
 
         self._save_fname = "screen"
         self._save_flag = False
@@ -116,8 +117,7 @@ class VispySketch(app.Canvas):
             elif not self.looping:
                 pass
 
-            while len(self.handler_queue) != 0:
-                function, event = self.handler_queue.pop(0)
+            for function, event in self.handler_queue.drain():
                 event._update_builtins()
                 function(event)
 
@@ -163,7 +163,7 @@ class VispySketch(app.Canvas):
 
     def _enqueue_event(self, handler_name, event):
         event._update_builtins()
-        self.handler_queue.append((self.handlers[handler_name], event))
+        self.handler_queue.append(handler_name, self.handlers[handler_name], event)
 
     def on_key_press(self, event):
         kev = KeyEvent(event, active=True)
@@ -53,6 +53,28 @@ from .shaders2d import src_line
 from .shaders2d import src_texture
 from .shape import PShape, Arc
 
+# Primitive types that are converted to plain triangles so that runs of
+# them can be drawn together
+_TRIANGLE_TYPES = {"triangles", "triangle_strip", "triangle_fan"}
+
+
+def _triangle_indices(draw_type, idx):
+    """Return triangle-list indices drawing the same faces as `idx`.
+
+    :param draw_type: One of 'triangles', 'triangle_strip' or
+        'triangle_fan'.
+
+    :param idx: Indices of the primitive.
+
+    """
+    idx = np.asarray(idx, dtype=np.uint32)
+    if draw_type == "triangle_strip":
+        return np.column_stack((idx[:-2], idx[1:-1], idx[2:])).ravel()
+    if draw_type == "triangle_fan":
+        first = np.full(max(len(idx) - 2, 0), idx[0] if len(idx) else 0, np.uint32)
+        return np.column_stack((first, idx[1:-1], idx[2:])).ravel()
+    return idx
+
 
 class VispyRenderer2D(OpenGLRenderer):
     def __init__(self):
@@ -204,18 +226,32 @@ class VispyRenderer2D(OpenGLRenderer):
             )
 
     def flush_geometry(self):
-        """Flush all the shape geometry from the draw queue to the GPU."""
-        current_queue = []
-        for index, shape in enumerate(self.draw_queue):
-            current_shape = self.draw_queue[index][0]
-            current_queue.append(self.draw_queue[index][1])
+        """Flush all the shape geometry from the draw queue to the GPU.
+
+        Consecutive triangle, triangle strip and triangle fan shapes are
+        merged into a single draw call; everything else is drawn on its
+        own, in queue order.
+        """
+        triangles = []
+        for current_shape, shape_data in self.draw_queue:
+            if current_shape in _TRIANGLE_TYPES:
+                vertices, idx, color = shape_data
+                triangles.append(
+                    (vertices, _triangle_indices(current_shape, idx), color)
+                )
+                continue
+
+            if triangles:
+                self.render_default("triangles", triangles)
+                triangles = []
 
             if current_shape == "lines":
-                self.render_line(current_queue)
+                self.render_line([shape_data])
             else:
-                self.render_default(current_shape, current_queue)
+                self.render_default(current_shape, [shape_data])
 
-            current_queue = []
+        if triangles:
+            self.render_default("triangles", triangles)
 
         self.draw_queue = []
 
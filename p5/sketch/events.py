@@ -17,11 +17,46 @@
 #
 from __future__ import annotations
 import builtins
-from collections import namedtuple
+import sys
 from enum import IntEnum
-from typing import List, Tuple, Union, overload
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union, overload
+
+
+class Position:
+    """A pair of x and y values attached to a mouse event.
+
+    Can be unpacked and indexed like an ``(x, y)`` tuple. Unlike a
+    tuple it is mutable, and therefore not hashable.
+
+    """
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __getitem__(self, index):
+        return (self.x, self.y)[index]
+
+    def __len__(self):
+        return 2
+
+    def __eq__(self, other):
+        if isinstance(other, Position):
+            return self.x == other.x and self.y == other.y
+        if isinstance(other, tuple):
+            return (self.x, self.y) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Position(x={self.x}, y={self.y})"
 
-Position = namedtuple("Position", ["x", "y"])
 
 handler_names = [
     "key_pressed",
@@ -36,6 +71,90 @@ handler_names = [
     "mouse_wheel",
 ]
 
+# Handlers for which only the most recent pending event is dispatched.
+# Consecutive motion events are coalesced by the sketch backends so
+# that a burst of them between two frames reaches user code once.
+motion_handler_names = frozenset(("mouse_dragged", "mouse_moved"))
+
+
+class HandlerQueue:
+    """Handler calls waiting to be dispatched by a sketch backend.
+
+    Entries are ``(handler, event)`` pairs kept in arrival order,
+    except that a motion event (see :data:`motion_handler_names`)
+    replaces a pending one of the same kind if no other event has
+    been queued since.
+
+    """
+
+    __slots__ = ("_entries", "_motion_slots")
+
+    def __init__(self):
+        self._entries = []
+        self._motion_slots = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def append(self, handler_name, handler, event):
+        entry = (handler, event)
+        if handler_name in motion_handler_names:
+            index = self._motion_slots.get(handler_name)
+            if index is not None:
+                self._entries[index] = entry
+                return
+            self._motion_slots[handler_name] = len(self._entries)
+        else:
+            # Keep motion events ordered relative to presses, releases, etc.
+            self._motion_slots.clear()
+        self._entries.append(entry)
+
+    def drain(self):
+        """Remove and return all pending entries in dispatch order."""
+        entries = self._entries
+        self._entries = []
+        self._motion_slots.clear()
+        return entries
+
+
+# Bit assigned to each modifier key in ``Event._mod_mask``
+_SHIFT = 1
+_CTRL = 2
+_ALT = 4
+_META = 8
+
+_MODIFIER_BITS = {
+    "Shift": _SHIFT,
+    "Control": _CTRL,
+    "Alt": _ALT,
+    "Meta": _META,
+}
+
+
+class _MouseState:
+    """Mouse state shared with sketches as :data:`p5.mouse`.
+
+    Mirrors the ``mouse_x``, ``mouse_y``, ``pmouse_x``, ``pmouse_y``,
+    ``mouse_is_pressed`` and ``mouse_button`` globals as attributes.
+
+    """
+
+    __slots__ = ("x", "y", "px", "py", "pressed", "button")
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.px = 0
+        self.py = 0
+        self.pressed = False
+        self.button = None
+
+    def __repr__(self):
+        return f"Mouse(x={self.x}, y={self.y})"
+
+
+mouse = _MouseState()
+
 
 class MouseButtonEnum(IntEnum):
     LEFT = 1
@@ -43,6 +162,22 @@ class MouseButtonEnum(IntEnum):
     MIDDLE = 3
 
 
+_BUTTON_NAMES = {
+    MouseButtonEnum.LEFT: "LEFT",
+    MouseButtonEnum.RIGHT: "RIGHT",
+    MouseButtonEnum.MIDDLE: "MIDDLE",
+}
+
+_BUTTON_MAP = {
+    "CENTER": MouseButtonEnum.MIDDLE,
+    "MIDDLE": MouseButtonEnum.MIDDLE,
+    "LEFT": MouseButtonEnum.LEFT,
+    "RIGHT": MouseButtonEnum.RIGHT,
+}
+
+_NO_BUTTONS = frozenset()
+
+
 class MouseButton:
     """An abstraction over a set of mouse buttons.
 
@@ -50,16 +185,17 @@ class MouseButton:
 
     """
 
+    __slots__ = ("_buttons", "_buttons_set", "_button_names")
+
     def __init__(self, buttons: List[str]):
-        button_names = {
-            MouseButtonEnum.LEFT: "LEFT",
-            MouseButtonEnum.RIGHT: "RIGHT",
-            MouseButtonEnum.MIDDLE: "MIDDLE",
-        }
         self._buttons = buttons
-        self._button_names = (
-            [button_names[bt] for bt in self._buttons] if self._buttons else ""
-        )
+        if not buttons:
+            # Most events (plain mouse motion) carry no buttons.
+            self._buttons_set = _NO_BUTTONS
+            self._button_names = []
+            return
+        self._buttons_set = frozenset(buttons)
+        self._button_names = [_BUTTON_NAMES[bt] for bt in buttons]
 
     @property
     def buttons(self):
@@ -67,13 +203,7 @@ class MouseButton:
 
     def __eq__(self, other):
         if isinstance(other, str):
-            button_map = {
-                "CENTER": MouseButtonEnum.MIDDLE,
-                "MIDDLE": MouseButtonEnum.MIDDLE,
-                "LEFT": MouseButtonEnum.LEFT,
-                "RIGHT": MouseButtonEnum.RIGHT,
-            }
-            return button_map.get(other.upper(), -1) in self._buttons
+            return _BUTTON_MAP.get(other.upper(), -1) in self._buttons_set
         return self._buttons == other._buttons
 
     def __neq__(self, other):
@@ -97,30 +227,47 @@ class Key:
 
     """
 
+    __slots__ = ("name", "text", "_display")
+
     def __init__(self, name: str, text: str = ""):
-        self.name = name.upper()
-        self.text = text
+        # Interned so comparisons against string literals usually hit
+        # the identity check.
+        self.name = sys.intern(name.upper())
+        self.text = sys.intern(text)
+        self._display = self.text if self.text.isalnum() else self.name
 
     def __eq__(self, other: Union[Key, str]):
         if isinstance(other, str):
-            return other in [self.name, self.text]
+            return other == self.name or other == self.text
         return self.name == other.name and self.text == other.text
 
     def __neq__(self, other):
         return self != other
 
     def __str__(self):
-        return self.text if self.text.isalnum() else self.name
+        return self._display
 
     def __repr__(self):
         return f"Key({self.name})"
 
 
+@lru_cache(maxsize=256)
+def _get_key(name: str, text: str = "") -> Key:
+    """Return a shared :class:`Key` for the given name and text.
+
+    Key events for the same key are frequent (auto-repeat, typing)
+    and reuse one instance instead of building a new one each time.
+
+    """
+    return Key(name, text)
+
+
 class Event:
     """A generic sketch event.
 
     :param modifers: The set of modifiers held down at the time of the
-        event.
+        event. Only Shift, Control, Alt and Meta are recognized, and
+        :attr:`modifiers` lists them in that order.
     :type modifiers: str list
 
     :param pressed: If the key/button is held down when the event
@@ -129,8 +276,14 @@ class Event:
 
     """
 
+    __slots__ = ("_mod_mask", "_modifiers", "_active", "_raw")
+
     def __init__(self, raw_event, active: bool = False):
-        self._modifiers: List[str] = [k.name for k in raw_event.modifiers]
+        mod_mask = 0
+        for k in raw_event.modifiers:
+            mod_mask |= _MODIFIER_BITS.get(k.name, 0)
+        self._mod_mask = mod_mask
+        self._modifiers: Optional[List[str]] = None
         self._active = active
 
         self._raw = raw_event
@@ -141,6 +294,12 @@ class Event:
 
     @property
     def modifiers(self):
+        # Built from the mask on first access since most handlers never
+        # look at the full list.
+        if self._modifiers is None:
+            self._modifiers = [
+                name for name, bit in _MODIFIER_BITS.items() if self._mod_mask & bit
+            ]
         return self._modifiers
 
     @property
@@ -153,7 +312,7 @@ class Event:
         :returns: True if the shift-key was held down.
 
         """
-        return "Shift" in self._modifiers
+        return bool(self._mod_mask & _SHIFT)
 
     def is_ctrl_down(self) -> bool:
         """Was ctrl (command on Mac) held down during the event?
@@ -161,7 +320,7 @@ class Event:
         :returns: True if the ctrl-key was held down.
 
         """
-        return "Control" in self._modifiers
+        return bool(self._mod_mask & _CTRL)
 
     def is_alt_down(self) -> bool:
         """Was alt held down during the event?
@@ -169,7 +328,7 @@ class Event:
         :returns: True if the alt-key was held down.
 
         """
-        return "Alt" in self._modifiers
+        return bool(self._mod_mask & _ALT)
 
     def is_meta_down(self) -> bool:
         """Was the meta key (windows/option key) held down?
@@ -177,13 +336,15 @@ class Event:
         :returns: True if the meta-key was held down.
 
         """
-        return "Meta" in self._modifiers
+        return bool(self._mod_mask & _META)
 
     def _update_builtins(self):
         pass
 
 
 class KeyEvent(Event):
+    __slots__ = ("key",)
+
     @overload
     def __init__(self, key: Union[str, Key], pressed: bool):
         """Encapsulates information about a key event.
@@ -198,9 +359,9 @@ class KeyEvent(Event):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self._raw.key is not None:
-            self.key = Key(self._raw.key.name, self._raw.text)
+            self.key = _get_key(self._raw.key.name, self._raw.text)
         else:
-            self.key = Key("UNKNOWN")
+            self.key = _get_key("UNKNOWN")
 
     def _update_builtins(self):
         builtins.key_is_pressed = self.pressed
@@ -208,6 +369,8 @@ class KeyEvent(Event):
 
 
 class MouseEvent(Event):
+    __slots__ = ("x", "y", "position", "scroll", "count", "button")
+
     @overload
     def __init__(
         self,
@@ -245,15 +408,18 @@ class MouseEvent(Event):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        width = builtins.width
+        height = builtins.height
         x, y = self._raw.pos
-        x = max(min(builtins.width, x), 0)
-        y = max(min(builtins.height, builtins.height - y), 0)
+        x = 0 if x < 0 else (width if x > width else x)
+        y = 0 if y < 0 else (height if y > height else y)
         dx, dy = self._raw.delta
 
-        self.x = max(min(builtins.width, x), 0)
-        self.y = max(min(builtins.height, builtins.height - y), 0)
+        self.x = x
+        self.y = y
 
-        self.position = Position(x, y)
+        # position is measured from the bottom edge of the window
+        self.position = Position(x, height - y)
 
         # TODO: scroll should be renamed as delta
         # https://p5js.org/reference/#/p5/mouseWheel
@@ -274,6 +440,13 @@ class MouseEvent(Event):
         builtins.moved_x = builtins.mouse_x - builtins.pmouse_x
         builtins.moved_y = builtins.mouse_y - builtins.pmouse_y
 
+        mouse.px = mouse.x
+        mouse.py = mouse.y
+        mouse.x = self.x
+        mouse.y = self.y
+        mouse.pressed = self._active
+        mouse.button = builtins.mouse_button
+
     def __repr__(self):
         press = "pressed" if self.pressed else "not-pressed"
         return f"MouseEvent({press} at {self.position})"
@@ -0,0 +1,116 @@
+import unittest
+from types import SimpleNamespace
+
+from p5.sketch.events import Event, HandlerQueue, Key, KeyEvent, Position
+
+
+def _modifiers(*names):
+    return [SimpleNamespace(name=name) for name in names]
+
+
+class TestEvent(unittest.TestCase):
+    def test_modifier_checks(self):
+        event = Event(SimpleNamespace(modifiers=_modifiers("Meta", "Fn", "Shift")))
+        self.assertTrue(event.is_shift_down())
+        self.assertFalse(event.is_ctrl_down())
+        self.assertFalse(event.is_alt_down())
+        self.assertTrue(event.is_meta_down())
+
+    def test_modifiers_order(self):
+        # Unknown names are dropped and the rest use a fixed order
+        event = Event(SimpleNamespace(modifiers=_modifiers("Alt", "Fn", "Control")))
+        self.assertEqual(event.modifiers, ["Control", "Alt"])
+
+        event = Event(SimpleNamespace(modifiers=()))
+        self.assertEqual(event.modifiers, [])
+        self.assertFalse(event.is_shift_down())
+
+    def test_modifiers_snapshot(self):
+        raw_modifiers = _modifiers("Shift")
+        event = Event(SimpleNamespace(modifiers=raw_modifiers))
+        raw_modifiers.clear()
+        raw_modifiers.extend(_modifiers("Control"))
+        self.assertEqual(event.modifiers, ["Shift"])
+        self.assertTrue(event.is_shift_down())
+        self.assertFalse(event.is_ctrl_down())
+
+
+class TestPosition(unittest.TestCase):
+    def test_unpacking_and_indexing(self):
+        position = Position(3, 4)
+        x, y = position
+        self.assertEqual((x, y), (3, 4))
+        self.assertEqual(list(position), [3, 4])
+        self.assertEqual(len(position), 2)
+        self.assertEqual(position[0], 3)
+        self.assertEqual(position[1], 4)
+        self.assertEqual(position[-1], 4)
+        self.assertEqual(position[-2], 3)
+        with self.assertRaises(IndexError):
+            position[2]
+
+    def test_equality(self):
+        self.assertEqual(Position(3, 4), Position(3, 4))
+        self.assertNotEqual(Position(3, 4), Position(4, 3))
+        self.assertEqual(Position(3, 4), (3, 4))
+        self.assertEqual((3, 4), Position(3, 4))
+        self.assertNotEqual(Position(3, 4), (3, 5))
+        self.assertNotEqual(Position(3, 4), [3, 4])
+
+    def test_repr(self):
+        self.assertEqual(repr(Position(3, 4)), "Position(x=3, y=4)")
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(Position(3, 4))
+
+
+class TestHandlerQueue(unittest.TestCase):
+    def test_motion_events_are_coalesced(self):
+        queue = HandlerQueue()
+        queue.append("mouse_moved", "moved", 1)
+        queue.append("mouse_dragged", "dragged", 1)
+        queue.append("mouse_moved", "moved", 2)
+        queue.append("mouse_dragged", "dragged", 2)
+        self.assertEqual(queue.drain(), [("moved", 2), ("dragged", 2)])
+        self.assertEqual(len(queue), 0)
+
+    def test_order_kept_around_other_events(self):
+        queue = HandlerQueue()
+        queue.append("mouse_moved", "moved", 1)
+        queue.append("mouse_pressed", "pressed", 2)
+        queue.append("mouse_moved", "moved", 3)
+        queue.append("mouse_moved", "moved", 4)
+        self.assertEqual(queue.drain(), [("moved", 1), ("pressed", 2), ("moved", 4)])
+
+    def test_drain_resets_motion_slots(self):
+        queue = HandlerQueue()
+        queue.append("mouse_moved", "moved", 1)
+        queue.drain()
+        queue.append("mouse_moved", "moved", 2)
+        self.assertEqual(queue.drain(), [("moved", 2)])
+
+
+class TestKey(unittest.TestCase):
+    def test_string_comparison(self):
+        key = Key("a", "a")
+        self.assertEqual(key, "A")
+        self.assertEqual(key, "a")
+        self.assertNotEqual(key, "B")
+        self.assertEqual(Key("enter", "\r"), "ENTER")
+        self.assertEqual(Key("enter", "\r"), "\r")
+
+    def test_key_comparison(self):
+        self.assertEqual(Key("a", "a"), Key("A", "a"))
+        self.assertNotEqual(Key("a", "a"), Key("a", "A"))
+
+    def test_key_event(self):
+        raw = SimpleNamespace(modifiers=[], key=SimpleNamespace(name="a"), text="a")
+        self.assertEqual(KeyEvent(raw).key, "A")
+
+        raw = SimpleNamespace(modifiers=[], key=None, text="")
+        self.assertEqual(KeyEvent(raw).key, "UNKNOWN")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,7 +27,7 @@ import sys
 import time
 from functools import wraps
 
-from .events import handler_names
+from .events import handler_names, mouse
 
 from ..core import p5
 from ..pmath import matrix
@@ -50,6 +50,7 @@ __all__ = [
     "is_looping",
     "set_frame_rate",
     "pixel_density",
+    "mouse",
 ]
 
 builtins.width = 360
@@ -15,7 +15,7 @@ def setup():
 def draw():
     global barWidth, lastBar
 
-    whichBar = mouse_x / barWidth
+    whichBar = int(mouse_x // barWidth)
     if whichBar != lastBar:
         barX = whichBar * barWidth
         fill(mouse_x, height, height)
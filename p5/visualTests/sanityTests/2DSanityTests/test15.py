@@ -1,7 +1,7 @@
 from p5 import *
 
 bar_width = 20
-last_bar = None
+last_state = None
 
 
 def setup():
@@ -13,10 +13,10 @@ def setup():
 
 
 def draw():
-    global last_bar
-    which_bar = mouse_x // bar_width
-    if which_bar is not last_bar:
-        bar_x = which_bar * bar_width
+    global last_state
+    state = (mouse_x // bar_width, mouse_y)
+    if state != last_state:
+        bar_x = state[0] * bar_width
         fill(bar_x, 100, mouse_y)
         rect((bar_x, 0), bar_width, height)
-        last_bar = which_bar
+        last_state = state
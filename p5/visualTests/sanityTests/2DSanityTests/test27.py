@@ -13,13 +13,8 @@ def setup():
 def draw():
     background(100, 10, 20)
 
-    global x, y, easing
-    targetX = mouse_x
-    dx = targetX - x
-    x += dx * easing
-
-    targetY = mouse_y
-    dy = targetY - y
-    y += dy * easing
+    global x, y
+    x += (mouse_x - x) * easing
+    y += (mouse_y - y) * easing
 
     ellipse((x, y), 66, 66)
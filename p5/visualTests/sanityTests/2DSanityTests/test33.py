@@ -1,19 +1,25 @@
 from p5 import *
+import numpy as np
 
 scale = 0
+xs = None
+limits = None
 
 
 def setup():
     size(640, 360)
     no_stroke()
+    color_mode("RGB", 1)
 
-    global scale
+    global scale, xs, limits
     scale = width / 20
+    columns = np.arange(int(scale))
+    xs = columns * scale
+    limits = (columns + 1) * scale * 10
 
 
 def draw():
-    global scale
-    for i in range(int(scale)):
-        color_mode("RGB", (i + 1) * scale * 10)
-        fill(millis() % ((i + 1) * scale * 10))
-        rect([i * scale, 0], scale, height)
+    grays = (millis() % limits) / limits
+    for x, gray in zip(xs, grays):
+        fill(gray)
+        rect([x, 0], scale, height)
@@ -1,25 +1,35 @@
 from p5 import *
+from p5.pmath import matrix
+import numpy as np
+
+box_transform = None
 
 
 def setup():
     size(640, 360)
 
+    global box_transform
+    box_transform = (
+        matrix.translation_matrix(-130, 0, 0)
+        .dot(matrix.rotation_matrix(np.array([0, 1, 0]), 1.25))
+        .dot(matrix.rotation_matrix(np.array([1, 0, 0]), -0.4))
+    )
+
 
 def draw():
     background(0)
     lights()
 
     with push_matrix():
-        translate(-130, 0, 0)
-        rotate_y(1.25)
-        rotate_x(-0.4)
+        apply_matrix(box_transform)
         no_stroke()
         fill(255)
         blinn_phong_material()
         box(100, 100, 100)
 
-    with push_matrix():
-        translate(250, 0, -200)
-        no_fill()
-        stroke(255)
-        sphere(280)
+    # The transform matrix is reset at the start of every frame, so the
+    # last shape needs no push_matrix() of its own.
+    translate(250, 0, -200)
+    no_fill()
+    stroke(255)
+    sphere(280)